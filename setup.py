@@ -16,12 +16,12 @@ setup(
         "pyppeteer>=1.0.2,<2.0.0",
         "python-dotenv>=1.0.0,<2.0.0",
         "uvicorn>=0.23.2,<1.0.0",
-        "cachetools>=5.3.3,<6.0.0",
         "fake-useragent>=1.5.1,<2.0.0",
         "uvloop>=0.21.0,<1.0.0",
         "redis>=5.2.0,<6.0.0",
         "psutil>=6.1.0,<7.0.0",
         "nanoid>=2.0.0,<3.0.0",
+        "aiohttp>=3.9.0,<4.0.0",
     ],
     extras_require={
         "dev": [
@@ -4,9 +4,11 @@ from fastapi import FastAPI, HTTPException, status
 from web_pilot.api.routes import router as IndexRouter
 from web_pilot.api.routes.browser_pool import router as BrowserPoolRouter
 from web_pilot.api.routes.sessions import router as SessionsRouter
+from web_pilot.api.routes.pages import router as PagesRouter
 from web_pilot.config import config as conf
 from web_pilot.utils.headless import HeadlessUtil
 from web_pilot.clients.pools_admin import PoolAdmin
+from web_pilot.clients.http_client import HttpClient
 from web_pilot.utils.decorators import repeat_every
 from web_pilot.exc import (
     PoolIsInactiveError,
@@ -32,6 +34,7 @@ for router in [
     IndexRouter,
     BrowserPoolRouter,
     SessionsRouter,
+    PagesRouter,
 ]:
     app.include_router(router)
 
@@ -97,7 +100,7 @@ async def check_chromium():
 
 @repeat_every(interval=conf.idle_pool_deletion_interval)
 async def delete_unused_pools():
-    PoolAdmin.remove_deletion_candidates()
+    await PoolAdmin.remove_deletion_candidates()
 
 
 @repeat_every(interval=conf.pools_scaling_check_interval)
@@ -109,3 +112,8 @@ async def manage_pools_scaling():
 async def register_background_tasks():
     asyncio.create_task(delete_unused_pools())
     asyncio.create_task(manage_pools_scaling())
+
+
+@app.on_event("shutdown")
+async def close_http_client():
+    await HttpClient.close()
@@ -51,4 +51,4 @@ async def get_pool(pool_id: str):
     dependencies=[Depends(rate_limiter)],
 )
 async def delete_pool(pool_id: str, force: bool = Query(default=False)):
-    PoolAdmin.delete_pool(pool_id, force)
+    await PoolAdmin.delete_pool(pool_id, force)
@@ -0,0 +1,56 @@
+import asyncio
+
+from fastapi import APIRouter, status, HTTPException, Depends
+from fastapi.responses import JSONResponse
+from web_pilot.clients.pools_admin import PoolAdmin
+from web_pilot.config import config as conf
+from web_pilot.schemas.requests import FetchPageRequest, FetchPagesRequest
+from web_pilot.schemas.responses import PageContentResponse
+from web_pilot.utils.limiter import rate_limiter
+
+
+router = APIRouter(prefix=f"{conf.v1_url_prefix}/pages", tags=["Pages"])
+
+
+@router.post(
+    "/fetch",
+    response_model=PageContentResponse,
+    status_code=status.HTTP_200_OK,
+    description=(
+        "Fetch a page's contents, without starting a page session. Pages fetched with "
+        "'domcontentloaded' and no 'wait_for_content' skip the browser - they're requested over "
+        "plain HTTP, without the browser profile's cookies"
+    ),
+    dependencies=[Depends(rate_limiter)],
+)
+async def fetch_page_contents(pool_id: str, args: FetchPageRequest):
+    pool = PoolAdmin.get_pool(pool_id)
+    if not pool:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Pool not found")
+
+    browser = pool.get_least_busy_browser(create_if_none=True)
+    response = await asyncio.wait_for(
+        browser.fetch_page_contents(**args.dict()), timeout=conf.default_timeout
+    )
+    return JSONResponse(status_code=status.HTTP_200_OK, content=response)
+
+
+@router.post(
+    "/fetch-many",
+    status_code=status.HTTP_200_OK,
+    description=(
+        "Fetch the contents of multiple pages concurrently, without starting page sessions. "
+        "As with '/fetch', 'domcontentloaded' pages are requested without the browser's cookies"
+    ),
+    dependencies=[Depends(rate_limiter)],
+)
+async def fetch_many_page_contents(pool_id: str, args: FetchPagesRequest):
+    pool = PoolAdmin.get_pool(pool_id)
+    if not pool:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Pool not found")
+
+    browser = pool.get_least_busy_browser(create_if_none=True)
+    response = await asyncio.wait_for(
+        browser.fetch_many_page_contents(**args.dict()), timeout=conf.default_timeout
+    )
+    return JSONResponse(status_code=status.HTTP_200_OK, content={"pages": response})
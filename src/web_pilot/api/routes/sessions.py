@@ -91,7 +91,8 @@ async def perform_action_on_page(session_id: str, args: PageActionRequest):
     with logger.contextualize(session_id=session_id, action=args.action.value):
         # helper function
         async def action_on_page(session_id: str, args: PageActionRequest):
-            _, browser, page = PoolAdmin.get_session_parent_chain(session_id)
+            # peek - the session is refreshed in place, keeping its cache statistics
+            _, browser, page = PoolAdmin.get_session_parent_chain(session_id, peek=True)
             response = await page.perform_page_action(**args.dict())
             browser.put_page_session(page.id_, page)
             return JSONResponse(status_code=status.HTTP_200_OK, content=response)
@@ -1,4 +1,7 @@
+import os
 import uuid
+import asyncio
+import itertools
 import pydantic as pyd
 
 from typing import Optional
@@ -53,6 +56,26 @@ class BrowserPool:
     def mark_as_inactive(self) -> None:
         self._accepts_new_jobs = False
 
+    def _next_user_data_dir(self) -> str:
+        "Get the first profile directory of the pool which isn't used by any of its browsers"
+        used_dirs = {browser.config.get("userDataDir") for browser in self.browsers}
+        for slot in itertools.count():
+            user_data_dir = os.path.join(conf.user_data_dir, self.id_, f"profile-{slot}")
+            if user_data_dir not in used_dirs:
+                return user_data_dir
+
+    async def close(self) -> None:
+        "Close all of the pool's browsers - the pool is being deleted"
+        browsers, self._pool = self.browsers, {}
+        results = await asyncio.gather(
+            *(browser.close() for browser in browsers), return_exceptions=True
+        )
+        for browser, result in zip(browsers, results):
+            if isinstance(result, Exception):
+                logger.bind(pool_id=self.id_, browser_id=browser.id_).error(
+                    f"Failed to close browser: {result}"
+                )
+
     @run_if_pool_accepts_new_jobs
     def create_new_browser(self) -> LeasedBrowser:
         "Create and return a new browser instance"
@@ -61,12 +84,15 @@ class BrowserPool:
             raise BrowserPoolCapacityReachedError(
                 f"Max number of browsers in pool reached: {self._max_browsers}"
             )
-        new_browser = LeasedBrowser(browser_id, parent=self.id_, **self.config_template)
+        user_data_dir = self._next_user_data_dir() if conf.persist_session else None
+        new_browser = LeasedBrowser(
+            browser_id, parent=self.id_, user_data_dir=user_data_dir, **self.config_template
+        )
         self._pool[browser_id] = new_browser
+        new_browser.start_warm_up()
         logger.bind(pool_id=self.id_).info(f"Browser '{browser_id}' has been added to the pool")
         return new_browser
 
-    @pyd.validate_arguments
     @run_if_pool_accepts_new_jobs
     async def remove_browser_by_id(self, browser_id: str, force: bool = False) -> bool:
         "Remove browser from pool by its ID"
@@ -74,13 +100,12 @@ class BrowserPool:
             return False
 
         browser = self._pool[browser_id]
-        if browser and browser._browser:
+        if browser:
             await browser.close()
         del self._pool[browser_id]
         logger.bind(pool_id=self.id_).info(f"Browser '{browser_id}' has been removed from the pool")
         return True
 
-    @pyd.validate_arguments
     @run_if_pool_accepts_new_jobs
     def get_browser_by_id(self, browser_id: str) -> Optional[LeasedBrowser]:
         "Get browser by its ID"
@@ -116,14 +141,23 @@ class BrowserPool:
             "All browsers are currently at full capacity! try again later."
         )
 
+    def _avg_cpu_usage(self) -> float:
+        "Average CPU usage of the pool's running browsers - ignoring ones still warming up"
+        running = [
+            browser for browser in self.browsers if browser.is_launched and not browser.is_warming
+        ]
+        if not running:
+            return 0.0
+        return sum(browser.monitor_browser[0] for browser in running) / len(running)
+
     def auto_scale_up(self) -> Optional[LeasedBrowser]:
         "Scale up the pool by creating a new browser instance"
+        if not self.browsers:
+            return  # browsers are created on demand
         # Check if the total number of pages across all browsers is greater than 50% of current capacity
         total_page_cap = conf.browser_max_cached_items * len(self.browsers)
         total_active_pages = sum([browser.page_count for browser in self._pool.values()])
-        avg_cpu_usage = sum(browser.monitor_browser[0] for browser in self.browsers) / len(
-            self.browsers
-        )
+        avg_cpu_usage = self._avg_cpu_usage()
         if total_active_pages >= (total_page_cap * 0.6) or avg_cpu_usage >= 0.7:
             try:
                 self.create_new_browser()
@@ -136,15 +170,20 @@ class BrowserPool:
 
     async def auto_scale_down(self) -> None:
         "Scale down the pool by removing the least busy browser instance"
+        if not self.browsers:
+            return
         # Check if the total number of pages across all browsers is less than 25% of current capacity
         total_page_cap = conf.browser_max_cached_items * len(self.browsers)
         total_active_pages = sum([browser.page_count for browser in self._pool.values()])
-        avg_cpu_usage = sum(browser.monitor_browser[0] for browser in self.browsers) / len(
-            self.browsers
-        )
+        avg_cpu_usage = self._avg_cpu_usage()
         if total_active_pages <= (total_page_cap * 0.3) or avg_cpu_usage <= 0.3:
+            # freshly added browsers are skipped - they're still warming up or only hold warm pages
             candidates_for_deletion = [
-                browser for browser in self.browsers if browser.page_count == 0 or browser.is_idle
+                browser
+                for browser in self.browsers
+                if not browser.is_warming
+                and browser.is_idle
+                and browser.idle_time > conf.page_idle_timeout
             ]
             if len(candidates_for_deletion) > 0:
                 [
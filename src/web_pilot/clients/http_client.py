@@ -0,0 +1,91 @@
+import re
+import html
+import asyncio
+import aiohttp
+
+from typing import Optional
+from urllib.parse import urlsplit
+from web_pilot.config import config as conf
+from web_pilot.schemas.responses import PageContentResponse
+
+
+_TITLE_PATTERN = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_PROXY_SCHEMES = ("http",)  # aiohttp can't tunnel through socks or per-scheme proxy rules
+
+
+def _proxy_url(proxy_server: str) -> str:
+    "Chromium's `--proxy-server` accepts a bare `host:port` - aiohttp needs a scheme"
+    return proxy_server if "://" in proxy_server else f"http://{proxy_server}"
+
+
+def _parse_html(body: bytes, encoding: Optional[str]) -> tuple[str, str]:
+    "Decode a page's body and extract its title - CPU bound, meant to run off the event loop"
+    try:
+        content = body.decode(encoding or "utf-8", errors="replace")
+    except LookupError:  # unknown charset declared by the server
+        content = body.decode("utf-8", errors="replace")
+    match = _TITLE_PATTERN.search(content)
+    return content, html.unescape(match.group(1).strip()) if match else ""
+
+
+class HttpClient:
+    "Plain HTTP client for pages which don't require rendering - shares one connection pool"
+
+    _session: Optional[aiohttp.ClientSession] = None
+
+    @classmethod
+    def get_session(cls) -> aiohttp.ClientSession:
+        if cls._session is None or cls._session.closed:
+            cls._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=conf.default_timeout)
+            )
+        return cls._session
+
+    @classmethod
+    async def close(cls) -> None:
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+
+    @staticmethod
+    def supports_proxy(proxy_server: Optional[str]) -> bool:
+        "Whether requests can be sent through a browser's proxy server (or there isn't one)"
+        if not proxy_server:
+            return True
+        if ";" in proxy_server or "=" in proxy_server:  # per-scheme rules
+            return False
+        return urlsplit(_proxy_url(proxy_server)).scheme in _PROXY_SCHEMES
+
+    @classmethod
+    async def fetch_page_contents(
+        cls,
+        url: str,
+        headers: Optional[dict] = None,
+        proxy_server: Optional[str] = None,
+        verify_ssl: bool = True,
+    ) -> dict:
+        "Fetch a page's raw HTML, title and cookies - without executing any of its scripts"
+        proxy = _proxy_url(proxy_server) if proxy_server else None
+        async with cls.get_session().get(
+            url, headers=headers, proxy=proxy, ssl=verify_ssl
+        ) as response:
+            body = await response.read()
+            cookies = [
+                dict(
+                    name=cookie.key,
+                    value=cookie.value,
+                    domain=cookie["domain"],
+                    path=cookie["path"],
+                )
+                for cookie in response.cookies.values()
+            ]
+            final_url = str(response.url)
+            encoding = response.charset
+
+        # decoding and scanning large documents would otherwise stall every other session
+        content, title = await asyncio.to_thread(_parse_html, body, encoding)
+        return PageContentResponse(
+            url=final_url,
+            title=title,
+            content=content,
+            cookies=cookies,
+        ).dict()
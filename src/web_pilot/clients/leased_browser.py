@@ -4,21 +4,36 @@ import pydantic as pyd
 import pyppeteer.browser
 import pyppeteer.launcher
 import asyncio
+import time
 
+from collections import deque
 from typing import Optional
+from urllib.parse import urlsplit
 from web_pilot.config import config as conf
 from web_pilot.logger import logger
 from web_pilot.utils.ttl_cache import TTLCache
+from web_pilot.clients.http_client import HttpClient
 from web_pilot.clients.page_session import PageSession
 from web_pilot.utils.fake_ua import fake_user_agent, Platform, BrowserTypes
-from web_pilot.exc import FailedToLaunchBrowser
-from web_pilot.utils.sessions import generate_id
+from web_pilot.exc import FailedToLaunchBrowser, NoAvailableBrowserError
+from web_pilot.utils.sessions import generate_id, perform_action_goto
+from web_pilot.schemas.requests import GotoArgs
+from web_pilot.schemas.responses import PageContentResponse
 
 
 class LeasedBrowser:
     id_: str
     _browser: pyppeteer.browser.Browser
     pages: TTLCache
+    _launch_lock: asyncio.Lock
+    _page_slots: asyncio.Semaphore
+    _warm_pages: deque[pyppeteer.page.Page]
+    _page_origins: dict[pyppeteer.page.Page, set[str]]
+    _warm_up_task: Optional[asyncio.Task]
+    _last_used: float
+    proxy_server: Optional[str]
+    ignore_http_errors: bool
+    user_agent: str
     platform: Platform
     browser_type: BrowserTypes
     _parent: str
@@ -37,12 +52,24 @@ class LeasedBrowser:
         proxy_server: Optional[str] = None,
         platform: Optional[Platform] = None,
         browser: Optional[BrowserTypes] = None,
+        user_data_dir: Optional[str] = None,
     ) -> None:
         "Create Browser instance"
         self.id_ = id_
         self._browser = None
         self._parent = parent
-        self.pages = TTLCache()
+        self.pages = TTLCache(caching_value=lambda page: page.action_count)
+        self._launch_lock = asyncio.Lock()
+        # pages beyond the session cache's size couldn't be held by sessions anyway
+        self._page_slots = asyncio.Semaphore(
+            conf.browser_max_pages or conf.browser_max_cached_items
+        )
+        self._warm_pages = deque()
+        self._page_origins = {}
+        self._warm_up_task = None
+        self._last_used = time.monotonic()
+        self.proxy_server = proxy_server
+        self.ignore_http_errors = ignore_http_errors
         self.config = self._load_browser_config(
             headless,
             incognito,
@@ -53,6 +80,7 @@ class LeasedBrowser:
             proxy_server,
             platform,
             browser,
+            user_data_dir,
         )
         self.platform = platform
         self.browser_type = browser
@@ -78,11 +106,11 @@ class LeasedBrowser:
         proxy_server: Optional[str],
         platform: Optional[Platform],
         browser: Optional[BrowserTypes],
+        user_data_dir: Optional[str],
     ) -> dict:
         config = {
             "headless": True if headless else False,
             "autoClose": False,
-            "userDataDir": conf.user_data_dir,
             "executablePath": conf.chromium_path,
             "args": [
                 f"--host-resolver-rules=MAP localhost {conf.host_address}",
@@ -106,10 +134,13 @@ class LeasedBrowser:
             config["args"].append("--disable-background-timer-throttling")
         if proxy_server:
             config["args"].append(f"--proxy-server={proxy_server}")
-        if browser:
-            config["args"].append(f"--user-agent={fake_user_agent(type=browser)}")
+        # picked once, so that pages fetched over plain HTTP identify the same as the browser
+        self.user_agent = fake_user_agent(type=browser)
+        config["args"].append(f"--user-agent={self.user_agent}")
         if platform:
             config["args"].append(f"--platform={platform}")
+        if user_data_dir:
+            config["userDataDir"] = user_data_dir
         return config
 
     async def _instantiate_browser(self) -> None:
@@ -117,7 +148,7 @@ class LeasedBrowser:
         try:
             self._browser = await pyppeteer.launch(**self.config)
 
-        except pyppeteer.errors.PuppeteerError as e:
+        except pyppeteer.errors.PyppeteerError as e:
             logger.bind(browser_id=self.id_).error(f"Failed to launch browser: {e}", exc_info=True)
             raise FailedToLaunchBrowser(e)
 
@@ -126,15 +157,24 @@ class LeasedBrowser:
         return len(self.pages)
 
     @property
-    def pid(self) -> int:
+    def is_launched(self) -> bool:
+        return self._browser is not None
+
+    @property
+    def pid(self) -> Optional[int]:
+        if not self.is_launched:
+            return None  # not launched yet, or its launch failed
         process = self._browser.process
         return process.pid
 
     @property
     def monitor_browser(self) -> tuple[float, float]:
         """Monitor the resource usage of a browser process."""
+        pid = self.pid
+        if pid is None:
+            return 0, 0
         try:
-            process = psutil.Process(self.pid)
+            process = psutil.Process(pid)
             cpu_usage = (
                 process.cpu_percent(interval=0.1) / psutil.cpu_count()
             )  # CPU usage of the process
@@ -152,16 +192,129 @@ class LeasedBrowser:
     def has_capacity(self) -> bool:
         return self.page_count < conf.browser_max_cached_items
 
+    @property
+    def is_warming(self) -> bool:
+        return self._warm_up_task is not None and not self._warm_up_task.done()
+
+    @property
+    def idle_time(self) -> float:
+        "Seconds since a page of the browser was last taken or given back"
+        return time.monotonic() - self._last_used
+
     async def close(self) -> None:
-        await self._browser.close()
+        "Close the browser - waiting for an in-flight launch, so its Chromium isn't orphaned"
+        if self.is_warming:
+            await asyncio.wait([self._warm_up_task])
+        async with self._launch_lock:
+            if self._browser is not None:
+                browser, self._browser = self._browser, None
+                self._warm_pages.clear()
+                self._page_origins.clear()
+                await browser.close()
+
+    async def get_browser(self) -> pyppeteer.browser.Browser:
+        "Get the Pyppeteer browser instance - launching it once, on first use"
+        if self._browser is None:
+            async with self._launch_lock:
+                if self._browser is None:
+                    await self._instantiate_browser()
+        return self._browser
+
+    def start_warm_up(self) -> asyncio.Task:
+        "Warm the browser up in the background"
+        self._warm_up_task = asyncio.ensure_future(self.warm_up())
+        return self._warm_up_task
+
+    async def warm_up(self) -> None:
+        "Launch the browser and pre-open blank pages, so the first sessions don't wait for either"
+        try:
+            browser = await self.get_browser()
+            while len(self._warm_pages) < conf.browser_warm_pages:
+                self._warm_pages.append(await self._new_page())
+            logger.bind(browser_id=self.id_).debug("Browser warmed-up successfully")
+
+        except Exception as e:
+            logger.bind(browser_id=self.id_).error(f"Failed to warm-up browser: {e}")
+
+    async def _new_page(self) -> pyppeteer.page.Page:
+        "Open a new page - recording the origins its frames navigate to, for `_release_page`"
+        page = await self._browser.newPage()
+        origins = self._page_origins[page] = set()
+
+        def record_origin(frame: pyppeteer.frame_manager.Frame) -> None:
+            url = urlsplit(frame.url)
+            if url.scheme in ("http", "https"):
+                origins.add(f"{url.scheme}://{url.netloc}")
+
+        page.on("framenavigated", record_origin)
+        return page
+
+    async def _clear_session_storage(self, page: pyppeteer.page.Page) -> None:
+        "Clear the tab's sessionStorage of every origin it visited - it survives navigation"
+        origins = self._page_origins.get(page)
+        if not origins:
+            return
+        await page._client.send("DOMStorage.enable")
+        for origin in origins:
+            await page._client.send(
+                "DOMStorage.clear",
+                {"storageId": {"securityOrigin": origin, "isLocalStorage": False}},
+            )
+        await page._client.send("DOMStorage.disable")
+        origins.clear()
+
+    async def _close_page(self, page: pyppeteer.page.Page) -> None:
+        self._page_origins.pop(page, None)
+        await page.close()
+
+    async def _acquire_page(self) -> pyppeteer.page.Page:
+        "Take a free page slot - reusing a warm blank page when there is one"
+        try:
+            await asyncio.wait_for(self._page_slots.acquire(), timeout=conf.page_acquire_timeout)
+        except asyncio.TimeoutError:
+            raise NoAvailableBrowserError(
+                "All pages of the browser are currently in use! try again later."
+            )
+
+        self._last_used = time.monotonic()
+        try:
+            while self._warm_pages:
+                page = self._warm_pages.popleft()
+                if not page.isClosed():
+                    return page
+                self._page_origins.pop(page, None)
+            return await self._new_page()
+
+        except Exception:
+            self._page_slots.release()
+            raise
+
+    async def _release_page(self, page: pyppeteer.page.Page, recycle: bool = True) -> None:
+        "Free a page slot - keeping the page open and blank for reuse while there is room for it"
+        self._last_used = time.monotonic()
+        try:
+            if recycle and len(self._warm_pages) < conf.browser_warm_pages and not page.isClosed():
+                try:
+                    await page.goto("about:blank")
+                    # the next session mustn't be able to navigate back into this one, nor
+                    # read what it left in the tab's sessionStorage
+                    await page._client.send("Page.resetNavigationHistory")
+                    await self._clear_session_storage(page)
+                    self._warm_pages.append(page)
+                    return
+                except Exception as e:  # pyppeteer's timeouts aren't PyppeteerErrors
+                    logger.bind(browser_id=self.id_).warning(f"Unable to recycle page: {e}")
+            await self._close_page(page)
+        finally:
+            self._page_slots.release()
 
     async def start_page_session(self, session_id_prefix: str) -> str:
         "Created new page and store it in cache by it's session-ID"
-        if not self._browser:
-            await self._instantiate_browser()
-
+        await self.get_browser()
         page_id = generate_id()
-        new_page_session = PageSession(page_obj=await self._browser.newPage(), page_id=page_id)
+        new_page_session = PageSession(
+            page_obj=await self._acquire_page(), page_id=page_id, release_page=self._release_page
+        )
         self.pages.set_item(page_id, new_page_session)
         session_id = f"{session_id_prefix}_{str(page_id)}"
         logger.bind(browser_id=self.id_).info(
@@ -169,6 +322,64 @@ class LeasedBrowser:
         )
         return session_id
 
+    async def fetch_page_contents(
+        self, url: str, wait_until: str = "load", wait_for_content: Optional[str] = None
+    ) -> dict:
+        """
+        Fetch a page's contents without starting a session.
+        Pages which don't need to be rendered (no waiting past DOM-content-loaded, nor for a
+        specific content) are fetched over plain HTTP, skipping the browser altogether - through
+        the browser's proxy, unless it's one the HTTP client can't use. Those requests share the
+        browser's user-agent, but not its profile: cookies persisted by the browser aren't sent.
+        """
+        if (
+            wait_until == "domcontentloaded"
+            and not wait_for_content
+            and HttpClient.supports_proxy(self.proxy_server)
+        ):
+            return await HttpClient.fetch_page_contents(
+                url,
+                headers={"User-Agent": self.user_agent},
+                proxy_server=self.proxy_server,
+                verify_ssl=not self.ignore_http_errors,
+            )
+
+        await self.get_browser()
+        page = await self._acquire_page()
+        try:
+            goto_args = GotoArgs(
+                url=url, options={"waitUntil": wait_until}, wait_for_text=wait_for_content
+            )
+            await perform_action_goto(page, goto_args)
+            title, content, cookies = await asyncio.gather(
+                page.title(), page.content(), page.cookies()
+            )
+            return PageContentResponse(
+                url=page.url, title=title, content=content, cookies=cookies
+            ).dict()
+        finally:
+            await self._release_page(page)
+
+    async def fetch_many_page_contents(
+        self,
+        urls: list[str],
+        wait_until: str = "load",
+        wait_for_content: Optional[str] = None,
+        concurrency: int = conf.fetch_max_concurrency,
+    ) -> list[dict]:
+        "Fetch the contents of multiple pages concurrently - failures are reported per URL"
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _fetch(url: str) -> dict:
+            async with semaphore:
+                return await self.fetch_page_contents(url, wait_until, wait_for_content)
+
+        results = await asyncio.gather(*(_fetch(url) for url in urls), return_exceptions=True)
+        return [
+            dict(url=url, error=str(result)) if isinstance(result, Exception) else result
+            for url, result in zip(urls, results)
+        ]
+
     def pop_page_session(self, page_id: str) -> PageSession:
         "Retrieves a page-session from cache memory"
         page_session: PageSession = self.pages.pop_item(page_id)
@@ -184,8 +395,10 @@ class LeasedBrowser:
         raise KeyError(f"Page not found [page: '{page_id}'] - session has already been closed!")
 
     def put_page_session(self, page_id: str, page: PageSession) -> None:
-        "Puts a page-session back to cache memory - resetting the TTL"
-        self.pages.set_item(page_id, page)
+        "Puts a page-session back to cache memory - resetting the TTL by its activity"
+        if page.is_closed:
+            return  # closed while an action was in flight
+        self.pages.set_item(page_id, page, ttl=page.expected_idle_time)
 
     async def close_page_session(self, page_id: str) -> None:
         "Closes and removes a cached page-session from memory - ending the session"
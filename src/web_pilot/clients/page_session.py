@@ -1,14 +1,34 @@
-import pydantic as pyd
 import pyppeteer
 import asyncio
+import math
+import time
 
-from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 from web_pilot.schemas.constants.page_action_type import PageActionType
 from web_pilot.logger import logger
 from web_pilot.utils.decorators import log_elapsed_time
 from web_pilot.exc import UnableToPerformActionError
 from web_pilot.config import config as conf
+from web_pilot.schemas.requests import (
+    PageActionArgs,
+    ClickArgs,
+    AuthenticateArgs,
+    SetUserAgentArgs,
+    OptionsArgs,
+    GotoArgs,
+    SetViewportArgs,
+    SetCookieArgs,
+    DeleteCookieArgs,
+    EvaluateArgs,
+    AddScriptTagArgs,
+    RemoveScriptTagArgs,
+    ExposeFunctionArgs,
+    RemoveFunctionArgs,
+    SetGeoLocationArgs,
+    EmulateMediaArgs,
+    SetContentArgs,
+    RestoreSnapshotArgs,
+)
 from web_pilot.utils.sessions import (
     perform_action_click,
     perform_action_authenticate,
@@ -35,24 +55,106 @@ from web_pilot.utils.sessions import (
     perform_action_setContent,
     perform_action_startJSCoverage,
     perform_action_stopJSCoverage,
+    perform_action_getPageMetrics,
+    perform_action_saveSnapshot,
+    perform_action_restoreSnapshot,
 )
 
 
+# Maps each action to its handler, and to the model its arguments are parsed into (if it takes any)
+_ACTION_TABLE: dict[
+    PageActionType, tuple[Callable[..., Awaitable[Any]], Optional[type[PageActionArgs]]]
+] = {
+    PageActionType.CLICK: (perform_action_click, ClickArgs),
+    PageActionType.AUTHENTICATE: (perform_action_authenticate, AuthenticateArgs),
+    PageActionType.SET_USER_AGENT: (perform_action_setUserAgent, SetUserAgentArgs),
+    PageActionType.SCREENSHOT: (perform_action_screenshot, OptionsArgs),
+    PageActionType.GOTO: (perform_action_goto, GotoArgs),
+    PageActionType.GO_BACK: (perform_action_goBack, OptionsArgs),
+    PageActionType.GO_FORWARD: (perform_action_goForward, OptionsArgs),
+    PageActionType.EVALUATE: (perform_action_evaluate, EvaluateArgs),
+    PageActionType.EXTRACT_PAGE_CONTENTS: (perform_action_extractPageContents, None),
+    PageActionType.EXPOSE_FUNCTION: (perform_action_exposeFunction, ExposeFunctionArgs),
+    PageActionType.REMOVE_FUNCTION: (perform_action_removeFunction, RemoveFunctionArgs),
+    PageActionType.SET_VIEWPORT: (perform_action_setViewport, SetViewportArgs),
+    PageActionType.SET_GEOLOCATION: (perform_action_setGeoLocation, SetGeoLocationArgs),
+    PageActionType.CLEAR_GEOLOCATION: (perform_action_clearGeolocation, None),
+    PageActionType.ADD_SCRIPT_TAG: (perform_action_addScriptTag, AddScriptTagArgs),
+    PageActionType.REMOVE_SCRIPT_TAG: (perform_action_removeScriptTag, RemoveScriptTagArgs),
+    PageActionType.EVALUATE_HANDLE: (perform_action_evaluateHandle, EvaluateArgs),
+    PageActionType.EVALUATE_ON_NEW_DOCUMENT: (perform_action_evaluateOnNewDocument, EvaluateArgs),
+    PageActionType.SET_COOKIE: (perform_action_setCookie, SetCookieArgs),
+    PageActionType.DELETE_COOKIE: (perform_action_deleteCookie, DeleteCookieArgs),
+    PageActionType.EMULATE_MEDIA: (perform_action_emulateMedia, EmulateMediaArgs),
+    PageActionType.START_JS_COVERAGE: (perform_action_startJSCoverage, None),
+    PageActionType.STOP_JS_COVERAGE: (perform_action_stopJSCoverage, None),
+    PageActionType.GET_PAGE_METRICS: (perform_action_getPageMetrics, None),
+    PageActionType.GET_ACCESSIBILITY_TREE: (perform_action_getAccessibilityTree, None),
+    PageActionType.SET_CONTENT: (perform_action_setContent, SetContentArgs),
+    PageActionType.SAVE_SNAPSHOT: (perform_action_saveSnapshot, None),
+    PageActionType.RESTORE_SNAPSHOT: (perform_action_restoreSnapshot, RestoreSnapshotArgs),
+}
+
+# Actions leaving page-level state behind (scripts, overrides, bindings...) - a page which had any
+# of those performed on it is closed at the end of its session, rather than recycled for reuse.
+_PAGE_STATE_ACTIONS = frozenset(
+    {
+        PageActionType.AUTHENTICATE,
+        PageActionType.SET_USER_AGENT,
+        PageActionType.SET_GEOLOCATION,
+        PageActionType.SET_VIEWPORT,
+        PageActionType.EXPOSE_FUNCTION,
+        PageActionType.EVALUATE_ON_NEW_DOCUMENT,
+        PageActionType.EMULATE_MEDIA,
+        PageActionType.START_JS_COVERAGE,
+        PageActionType.RESTORE_SNAPSHOT,
+    }
+)
+_LATENCY_EMA_ALPHA = 0.2
+
+
 class PageSession:
+    __slots__ = (
+        "_page",
+        "id_",
+        "_last_used",
+        "_latency_ema",
+        "_latency_var",
+        "action_count",
+        "_release_page",
+        "_is_recyclable",
+    )
+
     _page: pyppeteer.page.Page
     id_: str
-    _last_used: Optional[datetime]
-
-    def __init__(self, page_obj: pyppeteer.page.Page, page_id: int, **kwargs) -> None:
+    _last_used: float
+    _latency_ema: Optional[float]
+    _latency_var: float
+    action_count: int
+    _release_page: Optional[Callable[[pyppeteer.page.Page, bool], Awaitable[None]]]
+    _is_recyclable: bool
+
+    def __init__(
+        self,
+        page_obj: pyppeteer.page.Page,
+        page_id: int,
+        release_page: Optional[Callable[[pyppeteer.page.Page, bool], Awaitable[None]]] = None,
+        **kwargs,
+    ) -> None:
         self._page = page_obj
         self.id_ = page_id
-        self._last_used = datetime.now()
+        self._last_used = time.monotonic()
+        self._latency_ema = None
+        self._latency_var = 0.0
+        self.action_count = 0
+        self._release_page = release_page
+        self._is_recyclable = True
 
     def __repr__(self) -> dict:
         return dict(
             id=self.id_,
             is_idle=self.is_idle,
-            last_used=self._last_used,
+            idle_time=time.monotonic() - self._last_used,
             parent=self.id_.split("_")[0:2],
         )
 
@@ -61,128 +163,67 @@ class PageSession:
         asyncio.ensure_future(self.cleanup())
 
     async def cleanup(self) -> None:
+        page, self._page = self._page, None
+        if page is None:
+            return  # already cleaned up
+
         try:
-            await self._page.close()
+            if self._release_page:
+                await self._release_page(page, self._is_recyclable)
+            else:
+                await page.close()
             logger.bind(page_id=self.id_).debug("Page is closed successfully")
         except Exception as e:
             logger.bind(page_id=self.id_).error(f"Error during page cleanup: {e}")
 
     def update_last_used(self) -> None:
-        self._last_used = datetime.now()
+        now = time.monotonic()
+        latency = now - self._last_used
+        if self._latency_ema is None:
+            self._latency_ema = latency
+        else:
+            diff = latency - self._latency_ema
+            self._latency_ema += _LATENCY_EMA_ALPHA * diff
+            self._latency_var = (1 - _LATENCY_EMA_ALPHA) * (
+                self._latency_var + _LATENCY_EMA_ALPHA * diff * diff
+            )
+        self._last_used = now
+
+    @property
+    def expected_idle_time(self) -> Optional[float]:
+        "Estimated p95 of the time between consecutive actions, None until an action was performed"
+        if self._latency_ema is None:
+            return None
+        return self._latency_ema + 1.645 * math.sqrt(self._latency_var)
 
     @property
     def is_idle(self) -> bool:
         "Get page's status - idle if it hasn't been used in the last 3 minutes"
-        if self._last_used < (datetime.now() - timedelta(seconds=conf.page_idle_timeout)):
-            return True
-        return False
+        return time.monotonic() - self._last_used > conf.page_idle_timeout
+
+    @property
+    def is_closed(self) -> bool:
+        "Whether the page has already been released by `cleanup()`"
+        return self._page is None
 
     async def get_page_metrics(self) -> dict:
-        dom_size = await self._page.evaluate("document.getElementsByTagName('*').length")
-        navigation_timing = await self._page.evaluate("JSON.stringify(window.performance.timing)")
-        resource_perf = await self._page.evaluate("JSON.stringify(window.performance.getEntries())")
-        load_time = await self._page.evaluate(
-            """() => performance.timing.loadEventEnd - performance.timing.navigationStart"""
-        )
-        viewport = self._page.viewport
-        metrics = await self._page.metrics()
-
-        return {
-            "dom_size": dom_size,
-            "navigation_timing": navigation_timing,
-            "resource_perf": resource_perf,
-            "load_time": load_time,
-            "viewport": viewport,
-            "metrics": metrics,
-        }
-
-    @pyd.validate_arguments
+        return await perform_action_getPageMetrics(self._page)
+
     @log_elapsed_time
     async def perform_page_action(self, action: PageActionType, **kwargs) -> Any:
-        match action:
-            case PageActionType.CLICK:
-                call_method = perform_action_click
-
-            case PageActionType.AUTHENTICATE:
-                call_method = perform_action_authenticate
-
-            case PageActionType.SET_USER_AGENT:
-                call_method = perform_action_setUserAgent
-
-            case PageActionType.SCREENSHOT:
-                call_method = perform_action_screenshot
-
-            case PageActionType.GOTO:
-                call_method = perform_action_goto
-
-            case PageActionType.GO_BACK:
-                call_method = perform_action_goBack
-
-            case PageActionType.GO_FORWARD:
-                call_method = perform_action_goForward
-
-            case PageActionType.EVALUATE:
-                call_method = perform_action_evaluate
-
-            case PageActionType.EXTRACT_PAGE_CONTENTS:
-                call_method = perform_action_extractPageContents
-
-            case PageActionType.EXPOSE_FUNCTION:
-                call_method = perform_action_exposeFunction
-
-            case PageActionType.REMOVE_FUNCTION:
-                call_method = perform_action_removeFunction
-
-            case PageActionType.SET_VIEWPORT:
-                call_method = perform_action_setViewport
-
-            case PageActionType.SET_GEOLOCATION:
-                call_method = perform_action_setGeoLocation
-
-            case PageActionType.CLEAR_GEOLOCATION:
-                call_method = perform_action_clearGeolocation
-
-            case PageActionType.ADD_SCRIPT_TAG:
-                call_method = perform_action_addScriptTag
-
-            case PageActionType.REMOVE_SCRIPT_TAG:
-                call_method = perform_action_removeScriptTag
-
-            case PageActionType.EVALUATE_HANDLE:
-                call_method = perform_action_evaluateHandle
-
-            case PageActionType.EVALUATE_ON_NEW_DOCUMENT:
-                call_method = perform_action_evaluateOnNewDocument
-
-            case PageActionType.SET_COOKIE:
-                call_method = perform_action_setCookie
-
-            case PageActionType.REMOVE_COOKIE:
-                call_method = perform_action_deleteCookie
-
-            case PageActionType.EMULATE_MEDIA:
-                call_method = perform_action_emulateMedia
-
-            case PageActionType.START_JS_COVERAGE:
-                call_method = perform_action_startJSCoverage
-
-            case PageActionType.STOP_JS_COVERAGE:
-                call_method = perform_action_stopJSCoverage
-
-            case PageActionType.GET_PAGE_METRICS:
-                call_method = self.get_page_metrics
-
-            case PageActionType.GET_ACCESSIBILITY_TREE:
-                call_method = perform_action_getAccessibilityTree
+        if not isinstance(action, PageActionType):
+            action = PageActionType(action)
 
-            case PageActionType.SET_CONTENT:
-                call_method = perform_action_setContent
+        if action not in _ACTION_TABLE:
+            raise NotImplementedError(f"Action '{action}' is not supported!")
 
-            case _:
-                raise NotImplementedError(f"Action '{action}' is not supported!")
+        call_method, args_model = _ACTION_TABLE[action]
+        call_args = (self._page,) if args_model is None else (self._page, args_model(**kwargs))
+        if action in _PAGE_STATE_ACTIONS:
+            self._is_recyclable = False
 
         try:
-            return await call_method(self._page, **kwargs)
+            return await call_method(*call_args)
 
         except Exception as e:
             logger.bind(session_id=str(self.id_), page_action=action).error(
@@ -191,4 +232,5 @@ class PageSession:
             raise UnableToPerformActionError(e)
 
         finally:
+            self.action_count += 1
             self.update_last_used()
@@ -20,13 +20,13 @@ class PoolAdmin:
         return [pool.__repr__() for pool in cls._pools.values()]
 
     @classmethod
-    @pyd.validate_arguments
     def get_pool(cls, pool_id: str) -> Optional[BrowserPool]:
         "Get pool by its ID"
+        if not isinstance(pool_id, str):
+            raise TypeError(f"pool_id must be a string, got '{type(pool_id).__name__}'")
         return cls._pools.get(pool_id)
 
     @classmethod
-    @pyd.validate_arguments
     def get_session_parent_chain(
         cls, session_id: str, peek: bool = False
     ) -> Optional[Tuple[BrowserPool, LeasedBrowser, PageSession]]:
@@ -49,13 +49,13 @@ class PoolAdmin:
 
     @classmethod
     @pyd.validate_arguments
-    def delete_pool(cls, pool_id: str, force: bool = False) -> bool:
+    async def delete_pool(cls, pool_id: str, force: bool = False) -> bool:
         "Remove pool by its ID"
         if pool_id not in cls._pools:
             return False
 
         if force:
-            del cls._pools[pool_id]
+            await cls._pools.pop(pool_id).close()
         else:
             cls._deletion_candidates.append(pool_id)
             cls._pools[pool_id].mark_as_inactive()
@@ -63,16 +63,16 @@ class PoolAdmin:
 
     @classmethod
     @pyd.validate_arguments
-    def remove_deletion_candidates(cls) -> None:
+    async def remove_deletion_candidates(cls) -> None:
         logger.debug("Removing pools marked for deletion...")
-        for p_idx, pool_id in enumerate(cls._deletion_candidates):
+        for pool_id in list(cls._deletion_candidates):
             if pool_id not in cls._pools or not cls._pools[pool_id].is_idle:
                 logger.bind(pool_id=pool_id).info(
                     "Is candidate for deletion, but is currently busy - skipping deletion"
                 )
                 continue
-            del cls._pools[pool_id]
-            cls._deletion_candidates.pop(p_idx)
+            await cls._pools.pop(pool_id).close()
+            cls._deletion_candidates.remove(pool_id)
             logger.bind(pool_id=pool_id).info("Pool deleted successfully")
 
     @classmethod
@@ -85,6 +85,7 @@ class PoolAdmin:
                 f"A pool with these configuration already exists - pool_id:'{pool_id}'"
             )
         cls._pools[pool_id] = BrowserPool(pool_id, config)
+        cls._pools[pool_id].create_new_browser()  # launched in the background, ahead of use
         return pool_id
 
     @classmethod
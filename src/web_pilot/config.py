@@ -2,7 +2,7 @@ import os
 
 from pyppeteer import executablePath
 from pydantic import BaseSettings, Field
-from typing import Literal, Union
+from typing import Literal, Optional, Union
 from web_pilot.schemas.constants.cache import CacheProvider
 
 
@@ -35,6 +35,11 @@ class BaseConfig(BaseSettings):
     browser_pool_max_size: int = 1
     browser_max_cached_items: int = 100  # max pages cached in memory
     user_data_dir: str = "./user_data"
+    persist_session: bool = True  # keep a stable browser profile (cookies, storage, disk cache)
+    browser_max_pages: Optional[int] = None  # max open pages, defaults to browser_max_cached_items
+    browser_warm_pages: int = 5  # blank pages kept open per browser for reuse
+    page_acquire_timeout: int = 30  # seconds to wait for a free page slot
+    fetch_max_concurrency: int = 10  # max pages fetched concurrently by a single multi-URL fetch
 
     # Page Session config
     page_idle_timeout: int = 180  # 3 minutes
@@ -44,6 +49,8 @@ class BaseConfig(BaseSettings):
 
     # caching
     cache_ttl: float = 300  # 5 minutes
+    cache_min_ttl: float = 30  # lower bound for adaptive per-session TTLs
+    memory_limit_mb: Optional[int] = None  # defaults to the total system memory
     cache_provider: CacheProvider = CacheProvider.IN_MEMORY
     cache_cleanup_interval: int = 60  # 1 minute
 
@@ -1,43 +1,34 @@
 class BrowserPoolCapacityReachedError(Exception):
-    def __init__(self, message: str):
-        self.message = message
+    pass
 
 
 class NoAvailableBrowserError(Exception):
-    def __init__(self, message: str):
-        self.message = message
+    pass
 
 
 class UnableToPerformActionError(Exception):
-    def __init__(self, message: str):
-        self.message = message
+    pass
 
 
 class PoolAlreadyExistsError(Exception):
-    def __init__(self, message: str):
-        self.message = message
+    pass
 
 
 class PageSessionNotFoundError(Exception):
-    def __init__(self, message: str):
-        self.message = message
+    pass
 
 
 class FailedToLaunchBrowser(Exception):
-    def __init__(self, message: str):
-        self.message = message
+    pass
 
 
 class PoolIsInactiveError(Exception):
-    def __init__(self, message: str):
-        self.message = message
+    pass
 
 
 class RateLimitsExceededError(Exception):
-    def __init__(self, message: str):
-        self.message = message
+    pass
 
 
 class InvalidSessionIDError(Exception):
-    def __init__(self, message: str):
-        self.message = message
+    pass
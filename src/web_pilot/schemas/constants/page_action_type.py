@@ -30,3 +30,5 @@ class PageActionType(Enum):
     GET_PAGE_METRICS = "getPageMetrics"
     GET_ACCESSIBILITY_TREE = "getAccessibilityTree"
     SET_CONTENT = "setContent"
+    SAVE_SNAPSHOT = "saveSnapshot"
+    RESTORE_SNAPSHOT = "restoreSnapshot"
@@ -9,7 +9,7 @@ class PageContent(pyd.BaseModel):
 
 class Snapshot(pyd.BaseModel):
     url: str = pyd.Field(default="")
-    cookies: dict = pyd.Field(default={})
+    cookies: list = pyd.Field(default=[])
     local_storage: dict = pyd.Field(default={})
     session_storage: dict = pyd.Field(default={})
     dom_state: dict = pyd.Field(default={})
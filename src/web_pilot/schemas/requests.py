@@ -1,7 +1,8 @@
 import pydantic as pyd
 
-from typing import Optional
+from typing import Any, Literal, Optional
 from web_pilot.schemas.constants.page_action_type import PageActionType
+from web_pilot.schemas.pages import Snapshot
 
 
 class PoolAdminCreateReq(pyd.BaseModel):
@@ -24,3 +25,104 @@ class PageActionRequest(pyd.BaseModel):
 
     class Config:
         extra = "allow"
+
+
+class FetchPageRequest(pyd.BaseModel):
+    url: pyd.constr(min_length=1)
+    wait_until: Literal["load", "domcontentloaded", "networkidle0", "networkidle2"] = "load"
+    wait_for_content: Optional[str]
+
+    class Config:
+        extra = "forbid"
+
+
+class FetchPagesRequest(pyd.BaseModel):
+    urls: pyd.conlist(pyd.constr(min_length=1), min_items=1)
+    wait_until: Literal["load", "domcontentloaded", "networkidle0", "networkidle2"] = "load"
+    wait_for_content: Optional[str]
+
+    class Config:
+        extra = "forbid"
+
+
+# Page actions arguments
+class PageActionArgs(pyd.BaseModel):
+    class Config:
+        allow_population_by_field_name = True
+
+
+class ClickArgs(PageActionArgs):
+    selector: str
+    wait_for_selector: bool = pyd.Field(default=True, alias="waitForSelector")
+    options: Optional[dict]
+
+
+class AuthenticateArgs(PageActionArgs):
+    credentials: dict
+
+
+class SetUserAgentArgs(PageActionArgs):
+    user_agent: str
+
+
+class OptionsArgs(PageActionArgs):
+    options: Optional[dict]
+
+
+class GotoArgs(PageActionArgs):
+    url: pyd.constr(min_length=1)
+    options: Optional[dict]
+    wait_for_text: Optional[str] = pyd.Field(default=None, alias="waitForText")
+
+
+class SetViewportArgs(PageActionArgs):
+    width: int
+    height: int
+
+
+class SetCookieArgs(PageActionArgs):
+    cookies: list[dict]
+
+
+class DeleteCookieArgs(PageActionArgs):
+    cookies: list[dict] = pyd.Field(default=[])
+    all_: bool = pyd.Field(default=False, alias="all")
+
+
+class EvaluateArgs(PageActionArgs):
+    code: str
+    args: list = pyd.Field(default=[])
+
+
+class AddScriptTagArgs(PageActionArgs):
+    url: str
+
+
+class RemoveScriptTagArgs(PageActionArgs):
+    handle: Any
+
+
+class ExposeFunctionArgs(PageActionArgs):
+    name: str
+    code: str
+
+
+class RemoveFunctionArgs(PageActionArgs):
+    name: str
+
+
+class SetGeoLocationArgs(PageActionArgs):
+    latitude: float
+    longitude: float
+
+
+class EmulateMediaArgs(PageActionArgs):
+    media_type: Literal["screen", "print", "none"] = pyd.Field(alias="mediaType")
+
+
+class SetContentArgs(PageActionArgs):
+    content: str
+
+
+class RestoreSnapshotArgs(PageActionArgs):
+    snapshot: Snapshot
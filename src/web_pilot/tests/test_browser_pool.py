@@ -0,0 +1,89 @@
+import pytest
+import pyppeteer
+
+from unittest.mock import AsyncMock, MagicMock
+from web_pilot.clients.browser_pool import BrowserPool
+from web_pilot.clients.pools_admin import PoolAdmin
+from web_pilot.exc import InvalidSessionIDError, PageSessionNotFoundError
+
+
+@pytest.fixture
+def failing_launch(monkeypatch):
+    monkeypatch.setattr(
+        pyppeteer, "launch", AsyncMock(side_effect=pyppeteer.errors.BrowserError("no chromium"))
+    )
+
+
+@pytest.fixture
+def chromium(monkeypatch) -> MagicMock:
+    browser = MagicMock()
+    browser.close = AsyncMock()
+    browser.newPage = AsyncMock(return_value=MagicMock())
+    monkeypatch.setattr(pyppeteer, "launch", AsyncMock(return_value=browser))
+    return browser
+
+
+@pytest.mark.asyncio
+async def test_scaling_survives_failed_warm_up(failing_launch):
+    pool = BrowserPool("pool", {})
+    browser = pool.create_new_browser()
+    await browser._warm_up_task
+
+    assert not browser.is_launched
+    assert browser.monitor_browser == (0, 0)
+    pool.auto_scale_up()
+    await pool.auto_scale_down()
+
+
+@pytest.mark.asyncio
+async def test_scaling_skips_browsers_warming_up(chromium):
+    pool = BrowserPool("pool", {})
+    browser = pool.create_new_browser()
+
+    assert browser.is_warming
+    pool.auto_scale_up()
+    await pool.auto_scale_down()
+    assert browser.id_ in pool._pool
+    await browser._warm_up_task
+
+
+@pytest.mark.asyncio
+async def test_scaling_empty_pool():
+    pool = BrowserPool("pool", {})
+    pool.auto_scale_up()
+    await pool.auto_scale_down()
+    assert pool.browsers == []
+
+
+@pytest.mark.asyncio
+async def test_deleting_pool_closes_its_browsers(chromium):
+    pool_id = PoolAdmin.create_new_pool({"headless": True})
+    (browser,) = PoolAdmin.get_pool(pool_id).browsers
+
+    assert await PoolAdmin.delete_pool(pool_id, force=True)
+    assert PoolAdmin.get_pool(pool_id) is None
+    chromium.close.assert_awaited_once()
+    assert not browser.is_launched
+
+
+@pytest.mark.asyncio
+async def test_removing_deletion_candidates_closes_their_browsers(chromium):
+    pool_id = PoolAdmin.create_new_pool({"incognito": True})
+    await PoolAdmin.get_pool(pool_id).browsers[0]._warm_up_task
+
+    assert await PoolAdmin.delete_pool(pool_id)
+    await PoolAdmin.remove_deletion_candidates()
+    assert PoolAdmin.get_pool(pool_id) is None
+    assert pool_id not in PoolAdmin._deletion_candidates
+    chromium.close.assert_awaited_once()
+
+
+@pytest.mark.parametrize("session_id", [None, 123, "no-separators", "too_many_parts_here"])
+def test_invalid_session_id(session_id):
+    with pytest.raises(InvalidSessionIDError):
+        PoolAdmin.get_session_parent_chain(session_id)
+
+
+def test_unknown_session():
+    with pytest.raises(PageSessionNotFoundError):
+        PoolAdmin.get_session_parent_chain("pool_browser_page", peek=True)
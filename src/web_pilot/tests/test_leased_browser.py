@@ -0,0 +1,97 @@
+import asyncio
+import pytest
+import pytest_asyncio
+
+from unittest.mock import AsyncMock, MagicMock, call
+from web_pilot.clients.http_client import HttpClient
+from web_pilot.clients.leased_browser import LeasedBrowser
+
+
+def fake_page() -> MagicMock:
+    page = MagicMock()
+    page.isClosed.return_value = False
+    page.goto = AsyncMock()
+    page.close = AsyncMock()
+    page._client.send = AsyncMock()
+    return page
+
+
+def navigate(page: MagicMock, url: str) -> None:
+    (handler,) = [args[1] for args, _ in page.on.call_args_list if args[0] == "framenavigated"]
+    handler(MagicMock(url=url))
+
+
+@pytest_asyncio.fixture
+async def browser() -> LeasedBrowser:
+    browser = LeasedBrowser("browser", parent="pool")
+    browser._browser = MagicMock()
+    browser._browser.newPage = AsyncMock(side_effect=lambda: fake_page())
+    return browser
+
+
+@pytest.mark.asyncio
+async def test_recycled_page_has_its_session_storage_cleared(browser):
+    page = await browser._acquire_page()
+    navigate(page, "https://example.com/login")
+    navigate(page, "about:blank")
+    navigate(page, "http://localhost:8080/")
+
+    await browser._release_page(page)
+
+    assert list(browser._warm_pages) == [page]
+    page.close.assert_not_awaited()
+    page._client.send.assert_has_awaits(
+        [
+            call("Page.resetNavigationHistory"),
+            call("DOMStorage.enable"),
+            call("DOMStorage.disable"),
+        ],
+        any_order=True,
+    )
+    cleared = {
+        args[1]["storageId"]["securityOrigin"]
+        for args, _ in page._client.send.await_args_list
+        if args[0] == "DOMStorage.clear"
+    }
+    assert cleared == {"https://example.com", "http://localhost:8080"}
+    assert not browser._page_origins[page]  # a later session starts from a clean slate
+
+
+@pytest.mark.asyncio
+async def test_page_failing_to_recycle_is_closed(browser):
+    free_slots = browser._page_slots._value
+    page = await browser._acquire_page()
+    page.goto.side_effect = asyncio.TimeoutError("Navigation Timeout Exceeded")
+
+    await browser._release_page(page)
+
+    page.close.assert_awaited_once()
+    assert not browser._warm_pages
+    assert page not in browser._page_origins
+    assert browser._page_slots._value == free_slots
+
+
+@pytest.mark.asyncio
+async def test_non_recyclable_page_is_closed(browser):
+    page = await browser._acquire_page()
+
+    await browser._release_page(page, recycle=False)
+
+    page.close.assert_awaited_once()
+    page.goto.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_plain_http_fetch_identifies_as_the_browser(monkeypatch):
+    browser = LeasedBrowser("browser", parent="pool", proxy_server="10.0.0.1:3128")
+    fetch = AsyncMock(return_value={})
+    monkeypatch.setattr(HttpClient, "fetch_page_contents", fetch)
+
+    for _ in range(2):
+        await browser.fetch_page_contents("https://example.com", wait_until="domcontentloaded")
+
+    assert f"--user-agent={browser.user_agent}" in browser.config["args"]
+    for _, kwargs in fetch.await_args_list:
+        assert kwargs["headers"] == {"User-Agent": browser.user_agent}
+        assert kwargs["proxy_server"] == "10.0.0.1:3128"
+        assert kwargs["verify_ssl"] is False
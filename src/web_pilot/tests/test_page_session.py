@@ -0,0 +1,141 @@
+import pytest
+import pytest_asyncio
+import pydantic as pyd
+
+from fastapi import HTTPException
+from unittest.mock import AsyncMock, MagicMock
+from web_pilot.api.app import app
+from web_pilot.clients.page_session import PageSession
+from web_pilot.exc import UnableToPerformActionError
+from web_pilot.schemas.constants.page_action_type import PageActionType
+
+
+@pytest.fixture
+def page() -> MagicMock:
+    page = MagicMock()
+    for method in (
+        "click",
+        "waitForSelector",
+        "goto",
+        "waitForFunction",
+        "deleteCookie",
+        "deleteCookies",
+        "emulateMedia",
+        "evaluate",
+        "metrics",
+        "setContent",
+        "close",
+    ):
+        setattr(page, method, AsyncMock())
+    page.coverage.startJSCoverage = AsyncMock()
+    page.coverage.stopJSCoverage = AsyncMock(return_value=[])
+    page.accessibility.snapshot = AsyncMock(return_value={})
+    page.evaluate.return_value = {}
+    page.metrics.return_value = {}
+    return page
+
+
+@pytest_asyncio.fixture
+async def session(page) -> PageSession:
+    return PageSession(page, "page")
+
+
+async def response_status(exc: Exception) -> int:
+    "Status code the app responds with, for an exception raised by a route"
+    handler = next(
+        app.exception_handlers[cls] for cls in type(exc).__mro__ if cls in app.exception_handlers
+    )
+    with pytest.raises(HTTPException) as raised:
+        await handler(None, exc)
+    return raised.value.status_code
+
+
+@pytest.mark.asyncio
+async def test_click_passes_selector_through(session, page):
+    await session.perform_page_action("click", selector="#submit")
+
+    page.waitForSelector.assert_awaited_once_with("#submit")
+    page.click.assert_awaited_once_with("#submit", None)
+    assert session.action_count == 1
+
+
+@pytest.mark.asyncio
+async def test_click_wait_for_selector_alias(session, page):
+    await session.perform_page_action(
+        PageActionType.CLICK, selector="#submit", waitForSelector=False, options={"delay": 10}
+    )
+
+    page.waitForSelector.assert_not_awaited()
+    page.click.assert_awaited_once_with("#submit", {"delay": 10})
+
+
+@pytest.mark.asyncio
+async def test_goto_wait_for_text_alias(session, page):
+    await session.perform_page_action("goto", url="https://example.com", waitForText="Welcome")
+
+    page.goto.assert_awaited_once_with("https://example.com", None)
+    assert page.waitForFunction.await_args.args[-1] == "Welcome"
+
+
+@pytest.mark.asyncio
+async def test_emulate_media_type_alias(session, page):
+    await session.perform_page_action("emulateMedia", mediaType="print")
+    await session.perform_page_action("emulateMedia", mediaType="none")
+
+    assert [call.args for call in page.emulateMedia.await_args_list] == [("print",), (None,)]
+
+
+@pytest.mark.asyncio
+async def test_delete_cookie_all_alias(session, page):
+    await session.perform_page_action("deleteCookie", all=True)
+    await session.perform_page_action("deleteCookie", cookies=[{"name": "sid"}])
+
+    page.deleteCookies.assert_awaited_once_with()
+    page.deleteCookie.assert_awaited_once_with({"name": "sid"})
+
+
+@pytest.mark.asyncio
+async def test_missing_selector_is_a_bad_request(session, page):
+    with pytest.raises(pyd.ValidationError) as raised:
+        await session.perform_page_action("click")
+
+    page.click.assert_not_awaited()
+    assert await response_status(raised.value) == 400
+
+
+@pytest.mark.asyncio
+async def test_unknown_action_is_a_bad_request(session):
+    with pytest.raises(ValueError) as raised:
+        await session.perform_page_action("doSomethingElse")
+
+    assert await response_status(raised.value) == 400
+
+
+@pytest.mark.asyncio
+async def test_failing_action_is_wrapped(session, page):
+    page.click.side_effect = RuntimeError("Node is detached from document")
+
+    with pytest.raises(UnableToPerformActionError):
+        await session.perform_page_action("click", selector="#submit")
+    assert session.action_count == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "action, kwargs, method",
+    [
+        (PageActionType.EMULATE_MEDIA, {"mediaType": "screen"}, "emulateMedia"),
+        (PageActionType.START_JS_COVERAGE, {}, "coverage.startJSCoverage"),
+        (PageActionType.STOP_JS_COVERAGE, {}, "coverage.stopJSCoverage"),
+        (PageActionType.GET_PAGE_METRICS, {}, "metrics"),
+        (PageActionType.GET_ACCESSIBILITY_TREE, {}, "accessibility.snapshot"),
+        (PageActionType.SET_CONTENT, {"content": "<p>hi</p>"}, "setContent"),
+    ],
+)
+async def test_actions_after_delete_cookie_are_reachable(session, page, action, kwargs, method):
+    await session.perform_page_action(action, **kwargs)
+
+    target = page
+    for attr in method.split("."):
+        target = getattr(target, attr)
+    target.assert_awaited_once()
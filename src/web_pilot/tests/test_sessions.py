@@ -0,0 +1,79 @@
+import json
+import pytest
+
+from unittest.mock import AsyncMock, MagicMock, call
+from web_pilot.schemas.requests import RestoreSnapshotArgs
+from web_pilot.utils.sessions import perform_action_restoreSnapshot
+
+
+@pytest.fixture
+def page() -> MagicMock:
+    page = MagicMock()
+    page.setCookie = AsyncMock()
+    page.goto = AsyncMock()
+    page.evaluate = AsyncMock()
+    page._client.send = AsyncMock(return_value={"identifier": "7"})
+    return page
+
+
+def restore_args(**snapshot) -> RestoreSnapshotArgs:
+    return RestoreSnapshotArgs(snapshot=dict(url="https://example.com/app?tab=1", **snapshot))
+
+
+@pytest.mark.asyncio
+async def test_restore_snapshot_injects_storage_before_navigation(page):
+    calls = MagicMock()
+    calls.attach_mock(page.goto, "goto")
+    calls.attach_mock(page._client.send, "send")
+    args = restore_args(
+        cookies=[{"name": "sid", "value": "1", "domain": "example.com"}],
+        local_storage={"token": "</script>'\""},
+        session_storage={"tab": "1"},
+    )
+
+    await perform_action_restoreSnapshot(page, args)
+
+    page.setCookie.assert_awaited_once_with({"name": "sid", "value": "1", "domain": "example.com"})
+    add_script, goto, remove_script = calls.mock_calls
+    assert add_script.args[0] == "Page.addScriptToEvaluateOnNewDocument"
+    assert goto == call.goto("https://example.com/app?tab=1", {"waitUntil": "domcontentloaded"})
+    assert remove_script == call.send(
+        "Page.removeScriptToEvaluateOnNewDocument", {"identifier": "7"}
+    )
+    page.evaluate.assert_not_awaited()  # storage isn't written after the page's scripts ran
+
+    source = add_script.args[1]["source"]
+    data = json.loads(source[source.rindex(")(") + 2 : -1])
+    assert data == {
+        "origin": "https://example.com",
+        "local": {"token": "</script>'\""},
+        "session": {"tab": "1"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_restore_snapshot_removes_script_when_navigation_fails(page):
+    page.goto.side_effect = TimeoutError("Navigation Timeout Exceeded")
+
+    with pytest.raises(TimeoutError):
+        await perform_action_restoreSnapshot(page, restore_args(local_storage={"token": "1"}))
+    page._client.send.assert_awaited_with(
+        "Page.removeScriptToEvaluateOnNewDocument", {"identifier": "7"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_restore_snapshot_without_storage_navigates_only(page):
+    await perform_action_restoreSnapshot(page, restore_args())
+
+    page.goto.assert_awaited_once_with(
+        "https://example.com/app?tab=1", {"waitUntil": "domcontentloaded"}
+    )
+    page._client.send.assert_not_awaited()
+    page.setCookie.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_restore_snapshot_requires_url(page):
+    with pytest.raises(ValueError):
+        await perform_action_restoreSnapshot(page, RestoreSnapshotArgs(snapshot={}))
@@ -0,0 +1,186 @@
+import pytest
+
+from web_pilot.utils.timer_wheel import TimerWheelCache
+
+
+class FakeTimer:
+    "Manually advanced millisecond clock"
+
+    def __init__(self, now: int = 1_000_000) -> None:
+        self.now = now
+
+    def __call__(self) -> int:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += int(seconds * 1000)
+
+
+@pytest.fixture
+def timer() -> FakeTimer:
+    return FakeTimer()
+
+
+def fill(cache: TimerWheelCache, count: int, ttl: float = None, prefix: str = "filler") -> None:
+    for idx in range(count):
+        cache.set(f"{prefix}-{idx}", idx, ttl=ttl)
+
+
+@pytest.mark.parametrize("ttl", [0.5, 30, 90, 2 * 60 * 60, 24 * 60 * 60, 100 * 60 * 60])
+def test_expires_across_levels_when_full(timer, ttl):
+    cache = TimerWheelCache(maxsize=2, ttl=200 * 60 * 60, timer=timer)
+    cache.set("key", "value", ttl=ttl)
+    cache.set("other", "value")
+
+    timer.advance(ttl - 0.001)
+    cache.expire()
+    assert "key" in cache
+
+    timer.advance(2)  # one tick past the deadline - expired entries are dropped on tick boundaries
+    cache.expire()
+    assert "key" not in cache
+    assert len(cache) == 1
+
+
+def test_expired_entry_kept_until_hard_deadline(timer):
+    cache = TimerWheelCache(maxsize=10, ttl=60, timer=timer)
+    cache.set("key", "value", ttl=5)
+
+    timer.advance(30)
+    cache.expire()
+    assert cache.get("key") == "value"  # spare capacity - the TTL is a minimum lifetime
+
+    timer.advance(31)
+    cache.expire()
+    assert "key" not in cache
+    assert len(cache) == 0
+
+
+def test_expired_entry_dropped_on_read_when_full(timer):
+    cache = TimerWheelCache(maxsize=2, ttl=60, timer=timer)
+    cache.set("key", "value", ttl=5)
+    cache.set("other", "value")
+
+    timer.advance(6)
+    assert "key" not in cache
+    assert cache.get("key") is None
+    assert len(cache) == 1
+
+
+def test_reschedule_extends_expiration(timer):
+    cache = TimerWheelCache(maxsize=2, ttl=60 * 60, timer=timer)
+    cache.set("key", "first", ttl=10)
+    cache.set("other", "value")
+
+    timer.advance(5)
+    cache.set("key", "second", ttl=100)
+
+    timer.advance(50)
+    cache.expire()
+    assert cache["key"] == "second"
+
+    timer.advance(60)
+    cache.expire()
+    assert "key" not in cache
+
+
+def test_reschedule_shortens_expiration(timer):
+    cache = TimerWheelCache(maxsize=2, ttl=60 * 60, timer=timer)
+    cache.set("key", "first", ttl=30 * 60)
+    cache.set("other", "value")
+    cache.set("key", "second", ttl=10)
+
+    timer.advance(12)
+    cache.expire()
+    assert "key" not in cache
+
+
+def test_evicts_expired_entry_first(timer):
+    cache = TimerWheelCache(maxsize=20, ttl=60, timer=timer)
+    cache.set("stale", "value", ttl=1)
+    cache.set("fresh", "value")
+    fill(cache, 18)
+
+    timer.advance(2)
+    cache.set("new", "value")
+    assert len(cache) == 20
+    assert "stale" not in cache
+    assert "fresh" in cache
+    assert "new" in cache
+
+
+def test_evicts_lowest_caching_value_among_least_recently_used(timer):
+    cache = TimerWheelCache(maxsize=20, ttl=60, caching_value=lambda value: value, timer=timer)
+    cache.set("valuable", 5)
+    cache.set("cheap", 0)
+    fill(cache, 18, prefix="recent")
+
+    cache.set("new", 0)
+    assert "valuable" in cache
+    assert "cheap" not in cache
+
+
+def test_evicts_by_hit_ratio(timer):
+    cache = TimerWheelCache(maxsize=20, ttl=60, timer=timer)
+    cache.set("unused", 0)
+    cache.set("popular", 0)
+    fill(cache, 18, prefix="recent")
+    for _ in range(5):
+        cache.get("popular")
+    cache.set("popular", 0)  # refreshing in place keeps the hit statistics...
+    cache.set("unused", 0)  # ...and both go back to the most recently used end
+    for key in [f"recent-{idx}" for idx in range(18)]:
+        cache.set(key, 0)
+
+    cache.set("new", 0)
+    assert "popular" in cache
+    assert "unused" not in cache
+
+
+def test_pop(timer):
+    cache = TimerWheelCache(maxsize=2, ttl=60, timer=timer)
+    cache.set("key", "value", ttl=5)
+    cache.set("other", "value")
+
+    assert cache.pop("key") == "value"
+    assert "key" not in cache
+    assert cache.pop("key", None) is None
+    with pytest.raises(KeyError):
+        cache.pop("key")
+
+    cache.set("key", "value", ttl=5)
+    timer.advance(6)
+    assert cache.pop("key", "default") == "default"  # expired and full
+    assert len(cache) == 1
+
+
+def test_contains_does_not_count_as_hit(timer):
+    cache = TimerWheelCache(maxsize=2, ttl=60, timer=timer)
+    cache.set("key", "value")
+
+    assert "key" in cache
+    assert "missing" not in cache
+    assert cache._entries["key"].hits == 0
+    assert cache._lookups == 0
+
+
+def test_purge_expired_ignores_capacity(timer):
+    cache = TimerWheelCache(maxsize=10, ttl=60, timer=timer)
+    cache.set("stale", "value", ttl=1)
+    cache.set("fresh", "value")
+
+    timer.advance(2)
+    cache.purge_expired()
+    assert list(cache) == ["fresh"]
+
+
+def test_delete_unschedules_entry(timer):
+    cache = TimerWheelCache(maxsize=2, ttl=60, timer=timer)
+    cache.set("key", "value", ttl=5)
+    del cache["key"]
+
+    timer.advance(10)
+    cache.expire()  # must not trip over the removed entry
+    assert len(cache) == 0
+    with pytest.raises(KeyError):
+        del cache["key"]
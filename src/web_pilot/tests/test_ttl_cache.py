@@ -0,0 +1,46 @@
+import pytest
+
+from web_pilot.config import config as conf
+from web_pilot.utils import ttl_cache
+from web_pilot.utils.ttl_cache import TTLCache, memory_pressure, update_memory_pressure
+
+
+class FakeRss:
+    "Fake resident memory - counts how often the process tree is read"
+
+    def __init__(self) -> None:
+        self.used = 0
+        self.reads = 0
+
+    def __call__(self) -> int:
+        self.reads += 1
+        return self.used
+
+
+@pytest.fixture
+def rss(monkeypatch) -> FakeRss:
+    rss = FakeRss()
+    monkeypatch.setattr(ttl_cache, "_memory_limit", 1000)
+    monkeypatch.setattr(ttl_cache, "_memory_pressure", 0.0)
+    monkeypatch.setattr(ttl_cache, "_rss_used", rss)
+    return rss
+
+
+@pytest.mark.parametrize("used, pressure", [(500, 0.0), (700, 0.0), (800, 0.5), (950, 1.0)])
+def test_update_memory_pressure(rss, used, pressure):
+    rss.used = used
+    assert update_memory_pressure() == pytest.approx(pressure)
+    assert memory_pressure() == pytest.approx(pressure)
+
+
+@pytest.mark.asyncio
+async def test_set_item_uses_last_reading(rss):
+    cache = TTLCache()
+    rss.used = 800
+    update_memory_pressure()
+
+    cache.set_item("key", "value", ttl=conf.cache_ttl)
+
+    assert rss.reads == 1  # the process tree isn't walked on the request path
+    entry = cache._cache._entries["key"]
+    assert entry.expires_at - cache._cache._time == int(conf.cache_ttl * 0.5 * 1000)
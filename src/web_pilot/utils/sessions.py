@@ -1,15 +1,39 @@
-import pydantic as pyd
 import pyppeteer
 import asyncio
 import nanoid
 
+from datetime import datetime
+from pyppeteer.helper import evaluationString
+from urllib.parse import urlsplit
+
 from web_pilot.exc import InvalidSessionIDError
 from web_pilot.schemas.pages import Snapshot, PageContent
+from web_pilot.schemas.requests import (
+    ClickArgs,
+    AuthenticateArgs,
+    SetUserAgentArgs,
+    OptionsArgs,
+    GotoArgs,
+    SetViewportArgs,
+    SetCookieArgs,
+    DeleteCookieArgs,
+    EvaluateArgs,
+    AddScriptTagArgs,
+    RemoveScriptTagArgs,
+    ExposeFunctionArgs,
+    RemoveFunctionArgs,
+    SetGeoLocationArgs,
+    EmulateMediaArgs,
+    SetContentArgs,
+    RestoreSnapshotArgs,
+)
 
 
 # Utils
-@pyd.validate_arguments
 def break_session_id_to_parts(session_id: str) -> tuple:
+    if not isinstance(session_id, str):
+        raise InvalidSessionIDError("Invalid session ID")
+
     try:
         pool_id, browser_id, page_id = session_id.split("_")
         return (pool_id, browser_id, page_id)
@@ -23,150 +47,121 @@ def generate_id(len_=6) -> str:
 
 
 # Page actions
-async def perform_action_click(page: pyppeteer.page.Page, **kwargs) -> None:
-    if selector := kwargs.pop("selector", None) is None:
-        raise ValueError(f"Selector is required for 'click' action")
+async def perform_action_click(page: pyppeteer.page.Page, args: ClickArgs) -> None:
+    if args.wait_for_selector:
+        await page.waitForSelector(args.selector)
+    await page.click(args.selector, args.options)
 
-    wait_for_selector = kwargs.pop("waitForSelector", True)
-    options = kwargs.pop("options", None)
-    if wait_for_selector:
-        await page.waitForSelector(selector)
-    await page.click(selector, options)
 
+async def perform_action_authenticate(page: pyppeteer.page.Page, args: AuthenticateArgs) -> None:
+    await page.authenticate(args.credentials)
 
-async def perform_action_authenticate(page: pyppeteer.page.Page, **kwargs) -> None:
-    credentials = kwargs.pop("credentials")
-    await page.authenticate(credentials)
 
+async def perform_action_setUserAgent(page: pyppeteer.page.Page, args: SetUserAgentArgs) -> None:
+    await page.setUserAgent(args.user_agent)
 
-async def perform_action_setUserAgent(page: pyppeteer.page.Page, **kwargs) -> None:
-    user_agent = kwargs.pop("user_agent")
-    await page.setUserAgent(user_agent)
 
+async def perform_action_screenshot(page: pyppeteer.page.Page, args: OptionsArgs) -> None:
+    await page.screenshot(args.options)
 
-async def perform_action_screenshot(page: pyppeteer.page.Page, **kwargs) -> None:
-    options = kwargs.pop("options", None)
-    await page.screenshot(options)
 
-
-async def perform_action_goto(page: pyppeteer.page.Page, **kwargs) -> None:
+async def perform_action_goto(page: pyppeteer.page.Page, args: GotoArgs) -> None:
     async def _wait_for_text(
         page: pyppeteer.page.Page, text: str, timeout: int = 30000, interval: int = 500
     ) -> bool:
-        elapsed = 0
-        while elapsed < timeout:
-            content = await page.content()
-            if text in content:
-                return True
-            await asyncio.sleep(interval / 1000)
-            elapsed += interval
-        raise asyncio.TimeoutError(f"Timeout: Could not find '{text}' in the page content.")
-
-    url = kwargs.pop("url", None)
-    if not url:
-        raise ValueError("URL is required for 'goto' action")
+        # polls inside the renderer, and passes the text as an argument to avoid escaping issues
+        await page.waitForFunction(
+            "text => document.body && document.body.innerText.includes(text)",
+            {"timeout": timeout, "polling": interval},
+            text,
+        )
+        return True
 
-    options = kwargs.pop("options", None)
-    await page.goto(url, options)
-    if kwargs.get("waitForText"):
-        await _wait_for_text(page, kwargs.get("waitForText"))
+    await page.goto(args.url, args.options)
+    if args.wait_for_text:
+        await _wait_for_text(page, args.wait_for_text)
 
 
-async def perform_action_goBack(page: pyppeteer.page.Page, **kwargs) -> None:
-    options = kwargs.pop("options", None)
-    await page.goBack(options)
+async def perform_action_goBack(page: pyppeteer.page.Page, args: OptionsArgs) -> None:
+    await page.goBack(args.options)
 
 
-async def perform_action_goForward(page: pyppeteer.page.Page, **kwargs) -> None:
-    options = kwargs.pop("options", None)
-    await page.goForward(options)
+async def perform_action_goForward(page: pyppeteer.page.Page, args: OptionsArgs) -> None:
+    await page.goForward(args.options)
 
 
-async def perform_action_setViewport(page: pyppeteer.page.Page, **kwargs) -> None:
-    width = kwargs.pop("width")
-    height = kwargs.pop("height")
-    await page.setViewport({"width": width, "height": height})
+async def perform_action_setViewport(page: pyppeteer.page.Page, args: SetViewportArgs) -> None:
+    await page.setViewport({"width": args.width, "height": args.height})
 
 
-async def perform_action_setCookie(page: pyppeteer.page.Page, **kwargs) -> None:
-    cookies = kwargs.pop("cookies")
-    await page.setCookie(*cookies)
+async def perform_action_setCookie(page: pyppeteer.page.Page, args: SetCookieArgs) -> None:
+    await page.setCookie(*args.cookies)
 
 
-async def perform_action_deleteCookie(page: pyppeteer.page.Page, **kwargs) -> None:
-    cookies = kwargs.pop("cookies", None)
-    all_ = kwargs.pop("all", False)
-    if all_:
+async def perform_action_deleteCookie(page: pyppeteer.page.Page, args: DeleteCookieArgs) -> None:
+    if args.all_:
         await page.deleteCookies()
     else:
-        await page.deleteCookie(*cookies)
+        await page.deleteCookie(*args.cookies)
 
 
-async def perform_action_evaluate(page: pyppeteer.page.Page, **kwargs) -> None:
-    code = kwargs.pop("code")
-    args = kwargs.pop("args", [])
-    return await page.evaluate(code, *args)
+async def perform_action_evaluate(page: pyppeteer.page.Page, args: EvaluateArgs) -> None:
+    return await page.evaluate(args.code, *args.args)
 
 
-async def perform_action_evaluateOnNewDocument(page: pyppeteer.page.Page, **kwargs) -> None:
-    code = kwargs.pop("code")
-    args = kwargs.pop("args", [])
-    return await page.evaluateOnNewDocument(code, *args)
+async def perform_action_evaluateOnNewDocument(
+    page: pyppeteer.page.Page, args: EvaluateArgs
+) -> None:
+    return await page.evaluateOnNewDocument(args.code, *args.args)
 
 
-async def perform_action_evaluateHandle(page: pyppeteer.page.Page, **kwargs) -> None:
-    code = kwargs.pop("code")
-    args = kwargs.pop("args", [])
-    return await page.evaluateHandle(code, *args)
+async def perform_action_evaluateHandle(page: pyppeteer.page.Page, args: EvaluateArgs) -> None:
+    return await page.evaluateHandle(args.code, *args.args)
 
 
-async def perform_action_addScriptTag(page: pyppeteer.page.Page, **kwargs) -> None:
-    url = kwargs.pop("url")
-    return await page.addScriptTag(url=url)
+async def perform_action_addScriptTag(page: pyppeteer.page.Page, args: AddScriptTagArgs) -> None:
+    return await page.addScriptTag(url=args.url)
 
 
-async def perform_action_removeScriptTag(page: pyppeteer.page.Page, **kwargs) -> None:
-    handle = kwargs.pop("handle")
-    return await page.removeScriptTag(handle)
+async def perform_action_removeScriptTag(
+    page: pyppeteer.page.Page, args: RemoveScriptTagArgs
+) -> None:
+    return await page.removeScriptTag(args.handle)
 
 
-async def perform_action_exposeFunction(page: pyppeteer.page.Page, **kwargs) -> None:
-    name = kwargs.pop("name")
-    code = kwargs.pop("code")
-    return await page.exposeFunction(name, code)
+async def perform_action_exposeFunction(
+    page: pyppeteer.page.Page, args: ExposeFunctionArgs
+) -> None:
+    return await page.exposeFunction(args.name, args.code)
 
 
-async def perform_action_removeFunction(page: pyppeteer.page.Page, **kwargs) -> None:
-    name = kwargs.pop("name")
-    return await page.removeFunction(name)
+async def perform_action_removeFunction(
+    page: pyppeteer.page.Page, args: RemoveFunctionArgs
+) -> None:
+    return await page.removeFunction(args.name)
 
 
 async def perform_action_extractPageContents(page: pyppeteer.page.Page) -> PageContent:
-    return PageContent(
-        url=page.url,
-        title=await page.title(),
-        content=await page.content(),
-    ).dict()
+    title, content = await asyncio.gather(page.title(), page.content())
+    return PageContent(url=page.url, title=title, content=content).dict()
 
 
-async def perform_action_setGeoLocation(page: pyppeteer.page.Page, **kwargs) -> None:
-    latitude = kwargs.pop("latitude")
-    longitude = kwargs.pop("longitude")
-    await page.setGeolocation({"latitude": latitude, "longitude": longitude})
+async def perform_action_setGeoLocation(
+    page: pyppeteer.page.Page, args: SetGeoLocationArgs
+) -> None:
+    await page.setGeolocation({"latitude": args.latitude, "longitude": args.longitude})
 
 
 async def perform_action_clearGeolocation(page: pyppeteer.page.Page) -> None:
     await page.setGeolocation(None)
 
 
-async def perform_action_emulateMedia(page: pyppeteer.page.Page, **kwargs) -> None:
-    media_type = kwargs.pop("mediaType")  # Literal["screen", "print", "none"]
-    await page.emulateMedia(media_type)
+async def perform_action_emulateMedia(page: pyppeteer.page.Page, args: EmulateMediaArgs) -> None:
+    await page.emulateMedia(None if args.media_type == "none" else args.media_type)
 
 
-async def perform_action_setContent(page: pyppeteer.page.Page, **kwargs) -> None:
-    content = kwargs.pop("content")
-    await page.setContent(content)
+async def perform_action_setContent(page: pyppeteer.page.Page, args: SetContentArgs) -> None:
+    await page.setContent(args.content)
 
 
 async def perform_action_startJSCoverage(page: pyppeteer.page.Page) -> None:
@@ -179,3 +174,80 @@ async def perform_action_stopJSCoverage(page: pyppeteer.page.Page) -> list[dict]
 
 async def perform_action_getAccessibilityTree(page: pyppeteer.page.Page) -> dict:
     return await page.accessibility.snapshot()
+
+
+async def perform_action_getPageMetrics(page: pyppeteer.page.Page) -> dict:
+    # collect all in-page measurements within a single round-trip
+    page_metrics, metrics = await asyncio.gather(
+        page.evaluate(
+            """() => ({
+                dom_size: document.getElementsByTagName('*').length,
+                navigation_timing: JSON.stringify(window.performance.timing),
+                resource_perf: JSON.stringify(window.performance.getEntries()),
+                load_time: performance.timing.loadEventEnd - performance.timing.navigationStart,
+            })"""
+        ),
+        page.metrics(),
+    )
+    return {**page_metrics, "viewport": page.viewport, "metrics": metrics}
+
+
+async def perform_action_saveSnapshot(page: pyppeteer.page.Page) -> dict:
+    # storages are returned as plain objects - pyppeteer deserializes them straight into dicts
+    state = await page.evaluate(
+        """() => ({
+            url: window.location.href,
+            local_storage: Object.assign({}, window.localStorage),
+            session_storage: Object.assign({}, window.sessionStorage),
+            user_agent: navigator.userAgent,
+        })"""
+    )
+    return Snapshot(
+        **state,
+        cookies=await page.cookies(),
+        viewport_size=page.viewport or {},
+        timestamp=datetime.now().isoformat(),
+    ).dict()
+
+
+async def perform_action_restoreSnapshot(
+    page: pyppeteer.page.Page, args: RestoreSnapshotArgs
+) -> None:
+    snapshot = args.snapshot
+    if not snapshot.url:
+        raise ValueError("Snapshot URL is required for 'restoreSnapshot' action")
+
+    # cookies carry their own domain, so they can be set before the (single) navigation
+    if snapshot.cookies:
+        await page.setCookie(*snapshot.cookies)
+    if not snapshot.local_storage and not snapshot.session_storage:
+        await page.goto(snapshot.url, {"waitUntil": "domcontentloaded"})
+        return
+
+    # storages are written before any of the page's own scripts run (which may read them at
+    # startup), by a one-off script registered for the navigation - passed as an argument, rather
+    # than being formatted into the script's source
+    url = urlsplit(snapshot.url)
+    script = await page._client.send(
+        "Page.addScriptToEvaluateOnNewDocument",
+        {
+            "source": evaluationString(
+                """data => {
+                    if (window !== window.top || window.location.origin !== data.origin) return;
+                    Object.assign(window.localStorage, data.local);
+                    Object.assign(window.sessionStorage, data.session);
+                }""",
+                {
+                    "origin": f"{url.scheme}://{url.netloc}",
+                    "local": snapshot.local_storage,
+                    "session": snapshot.session_storage,
+                },
+            )
+        },
+    )
+    try:
+        await page.goto(snapshot.url, {"waitUntil": "domcontentloaded"})
+    finally:
+        await page._client.send(
+            "Page.removeScriptToEvaluateOnNewDocument", {"identifier": script["identifier"]}
+        )
@@ -0,0 +1,234 @@
+import itertools
+import math
+import time
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterator, Optional
+
+
+# Hierarchical wheel layout (times are in milliseconds):
+# ~1 sec, ~1 min, ~1 hour, ~18 hours and a single overflow bucket for anything further away.
+_BUCKETS = (64, 64, 32, 4, 1)
+_SPANS = (1 << 10, 1 << 16, 1 << 22, 1 << 26, 1 << 28)
+_SHIFT = tuple(span.bit_length() - 1 for span in _SPANS)
+
+# Share of least recently used entries considered when an eviction is required
+_EVICTION_SAMPLE_RATIO = 0.1
+_SCORE_DELTA = 1e-6
+
+
+def _monotonic_ms() -> int:
+    return time.monotonic_ns() // 1_000_000
+
+
+class _Entry:
+    __slots__ = (
+        "key",
+        "value",
+        "expires_at",
+        "hard_expires_at",
+        "hits",
+        "inserted_at_lookup",
+        "prev",
+        "next",
+    )
+
+    def __init__(
+        self,
+        key: Hashable = None,
+        value: Any = None,
+        expires_at: int = 0,
+        hard_expires_at: int = 0,
+        inserted_at_lookup: int = 0,
+    ) -> None:
+        self.key = key
+        self.value = value
+        self.expires_at = expires_at
+        self.hard_expires_at = hard_expires_at
+        self.hits = 0
+        self.inserted_at_lookup = inserted_at_lookup
+        self.prev = self
+        self.next = self
+
+    def unlink(self) -> None:
+        self.prev.next = self.next
+        self.next.prev = self.prev
+        self.prev = self.next = self
+
+
+class TimerWheelCache:
+    """
+    Size-bounded mapping with per-entry expiration, scheduled on a hierarchical timer wheel.
+    Reads and writes are O(1); expired entries are handled bucket-by-bucket as the wheel advances,
+    without sweeping the whole cache.
+
+    TTLs are treated as a minimum lifetime: an expired entry is kept (and served) while the cache
+    has spare capacity, and is dropped once the cache is full - or, at the latest, once the cache's
+    own TTL has passed since the entry was last set, regardless of capacity. When an insert
+    requires an eviction, the victim is picked among the least recently used 10% of entries,
+    preferring expired ones and then the lowest `log(caching_value + hit_ratio + δ)` score.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        caching_value: Optional[Callable[[Any], float]] = None,
+        timer: Callable[[], int] = _monotonic_ms,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._caching_value = caching_value or (lambda _: 0.0)
+        self._timer = timer
+        self._time = timer()
+        self._lookups = 0
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._wheel = [[_Entry() for _ in range(buckets)] for buckets in _BUCKETS]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and not self._is_stale(entry, self._timer())
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._entries)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        entry = self._lookup(key)
+        if entry is None:
+            raise KeyError(key)
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        self._remove(self._entries[key])
+
+    @property
+    def is_full(self) -> bool:
+        return len(self._entries) >= self.maxsize
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        "Insert or replace an entry, expiring after `ttl` seconds (defaults to the cache's TTL)"
+        self.expire()
+        expires_at = self._time + int((self.ttl if ttl is None else ttl) * 1000)
+        hard_expires_at = max(expires_at, self._time + int(self.ttl * 1000))
+        entry = self._entries.get(key)
+        if entry is None:
+            if self.is_full:
+                self._evict()
+            entry = _Entry(key, value, expires_at, hard_expires_at, self._lookups)
+            self._entries[key] = entry
+        else:
+            entry.unlink()
+            entry.value = value
+            entry.expires_at = expires_at
+            entry.hard_expires_at = hard_expires_at
+            self._entries.move_to_end(key)
+        self._schedule(entry)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def pop(self, key: Hashable, *default: Any) -> Any:
+        entry = self._lookup(key)
+        if entry is None:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        self._remove(entry)
+        return entry.value
+
+    def values(self) -> list[Any]:
+        return [entry.value for entry in self._entries.values()]
+
+    def items(self) -> list[tuple[Hashable, Any]]:
+        return [(key, entry.value) for key, entry in self._entries.items()]
+
+    def expire(self) -> None:
+        "Advance the wheel to the current time, evicting expired entries if the cache is full"
+        previous_time, self._time = self._time, self._timer()
+        for level, shift in enumerate(_SHIFT):
+            previous_ticks = previous_time >> shift
+            delta = (self._time >> shift) - previous_ticks
+            if delta <= 0:
+                break
+            self._expire_level(level, previous_ticks, delta)
+
+    def purge_expired(self) -> None:
+        "Evict every expired entry regardless of spare capacity - O(n), meant for memory pressure"
+        now = self._timer()
+        for entry in [entry for entry in self._entries.values() if entry.expires_at <= now]:
+            self._remove(entry)
+
+    def _lookup(self, key: Hashable) -> Optional[_Entry]:
+        self._lookups += 1
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._is_stale(entry, self._timer()):
+            self._remove(entry)
+            return None
+        entry.hits += 1
+        return entry
+
+    def _is_stale(self, entry: _Entry, now: int) -> bool:
+        "Whether an entry can no longer be served - past its hard deadline, or expired and full"
+        return entry.hard_expires_at <= now or (self.is_full and entry.expires_at <= now)
+
+    def _evict(self) -> None:
+        sample_size = max(1, int(len(self._entries) * _EVICTION_SAMPLE_RATIO))
+        candidates = itertools.islice(self._entries.values(), sample_size)
+        self._remove(min(candidates, key=self._eviction_priority))
+
+    def _eviction_priority(self, entry: _Entry) -> tuple[bool, float]:
+        lookups = self._lookups - entry.inserted_at_lookup
+        hit_ratio = entry.hits / lookups if lookups else 0.0
+        score = math.log(self._caching_value(entry.value) + hit_ratio + _SCORE_DELTA)
+        return entry.expires_at > self._time, score
+
+    def _expire_level(self, level: int, previous_ticks: int, delta: int) -> None:
+        buckets = self._wheel[level]
+        mask = len(buckets) - 1
+        start = previous_ticks & mask
+        for idx in range(start, start + min(delta + 1, len(buckets))):
+            sentinel = buckets[idx & mask]
+            node = sentinel.next
+            sentinel.prev = sentinel.next = sentinel
+            while node is not sentinel:
+                next_node = node.next
+                node.prev = node.next = node
+                if node.expires_at > self._time or (
+                    node.hard_expires_at > self._time and not self.is_full
+                ):
+                    self._schedule(node)  # not due yet, or extended up to its hard deadline
+                else:
+                    del self._entries[node.key]
+                node = next_node
+
+    def _schedule(self, entry: _Entry) -> None:
+        deadline = entry.expires_at if entry.expires_at > self._time else entry.hard_expires_at
+        sentinel = self._find_bucket(deadline)
+        entry.prev = sentinel.prev
+        entry.next = sentinel
+        sentinel.prev.next = entry
+        sentinel.prev = entry
+
+    def _find_bucket(self, expires_at: int) -> _Entry:
+        duration = expires_at - self._time
+        for level in range(len(self._wheel) - 1):
+            if duration < _SPANS[level + 1]:
+                ticks = expires_at >> _SHIFT[level]
+                return self._wheel[level][ticks & (_BUCKETS[level] - 1)]
+        return self._wheel[-1][0]
+
+    def _remove(self, entry: _Entry) -> None:
+        entry.unlink()
+        self._entries.pop(entry.key, None)
@@ -1,21 +1,62 @@
 import pydantic as pyd
-import cachetools
 import asyncio
+import psutil
 
-from typing import Union
+from typing import Any, Callable, Optional, Union
 from web_pilot.schemas.constants.cache import CacheProvider
 from web_pilot.config import config as conf
 from web_pilot.logger import logger
+from web_pilot.utils.timer_wheel import TimerWheelCache
+
+
+_process = psutil.Process()
+_memory_limit = (
+    conf.memory_limit_mb * 1024 * 1024 if conf.memory_limit_mb else psutil.virtual_memory().total
+)
+
+
+_memory_pressure = 0.0  # last reading, refreshed in the background by `update_memory_pressure()`
+
+
+def _rss_used() -> int:
+    "Resident memory of the server and all of its child processes (the Chromium browsers)"
+    rss_used = _process.memory_info().rss
+    for child in _process.children(recursive=True):
+        try:
+            rss_used += child.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return rss_used
+
+
+def update_memory_pressure() -> float:
+    "Take a new memory pressure reading - walks the process tree, so it's kept off the event loop"
+    global _memory_pressure
+    rss_used = _rss_used()
+    _memory_pressure = min(1.0, max(0.0, (rss_used - 0.7 * _memory_limit) / (0.2 * _memory_limit)))
+    return _memory_pressure
+
+
+def memory_pressure() -> float:
+    "Memory pressure - 0 below 70% of the memory limit, rising linearly to 1 at 90%"
+    return _memory_pressure
 
 
 class TTLCache:
-    def __init__(self) -> None:
-        self._cache = self._init_cache(max_items=conf.browser_max_cached_items, ttl=conf.cache_ttl)
+    def __init__(self, caching_value: Optional[Callable[[Any], float]] = None) -> None:
+        self._cache = self._init_cache(
+            max_items=conf.browser_max_cached_items, ttl=conf.cache_ttl, caching_value=caching_value
+        )
 
-    def _init_cache(self, max_items: int = None, ttl: int = None) -> Union[cachetools.TTLCache]:
+    def _init_cache(
+        self,
+        max_items: int = None,
+        ttl: int = None,
+        caching_value: Optional[Callable[[Any], float]] = None,
+    ) -> Union[TimerWheelCache]:
         match conf.cache_provider:
             case CacheProvider.IN_MEMORY:
-                return cachetools.TTLCache(maxsize=max_items, ttl=ttl)
+                return TimerWheelCache(maxsize=max_items, ttl=ttl, caching_value=caching_value)
             case _:
                 raise ValueError("Unsupported cache provider")
 
@@ -28,8 +69,11 @@ class TTLCache:
     def pop_item(self, key: str):
         return self._cache.pop(key)
 
-    def set_item(self, key: str, value: pyd.BaseModel) -> None:
-        self._cache.__setitem__(key, value)
+    def set_item(self, key: str, value: pyd.BaseModel, ttl: Optional[float] = None) -> None:
+        "Store an item - its TTL is capped by `cache_ttl` and shrinks as memory pressure rises"
+        ttl = conf.cache_ttl if ttl is None else min(ttl, conf.cache_ttl)
+        ttl = max(conf.cache_min_ttl, ttl * (1 - memory_pressure()))
+        self._cache.set(key, value, ttl=ttl)
 
     def delete_item(self, key: str) -> None:
         self._cache.__delitem__(key)
@@ -39,6 +83,8 @@ class TTLCache:
             await asyncio.sleep(conf.cache_cleanup_interval)
             try:
                 self._cache.expire()
+                if await asyncio.to_thread(update_memory_pressure) > 0:
+                    self._cache.purge_expired()
                 logger.debug("Cache periodic-cleanup completed successfully")
             except Exception as e:
                 logger.error(f"Error in exectuion of cache periodic-cleanup: {e}")